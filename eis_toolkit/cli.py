@@ -9,10 +9,6 @@ import os
 from enum import Enum
 from pathlib import Path
 
-import geopandas as gpd
-import numpy as np
-import pandas as pd
-import rasterio
 import typer
 from beartype.typing import List, Optional, Tuple, Union
 from typing_extensions import Annotated
@@ -93,6 +89,13 @@ class KrigingMethod(str, Enum):
     universal = "universal"
 
 
+class KrigingDevice(str, Enum):
+    """Devices for computing kriging predictions."""
+
+    cpu = "cpu"
+    cuda = "cuda"
+
+
 class MergeStrategy(str, Enum):
     """Merge strategies for rasterizing."""
 
@@ -116,7 +119,7 @@ class LogarithmTransforms(str, Enum):
 
 
 class ResamplingMethods(str, Enum):
-    """Resampling methods available."""
+    """Resampling methods available. Values match the member names of rasterio's Resampling enum."""
 
     nearest = "nearest"
     bilinear = "bilinear"
@@ -315,6 +318,8 @@ def get_enum_values(parameter: Union[Enum, List[Enum]]) -> Union[str, List[str]]
 @app.command()
 def normality_test_raster_cli(input_raster: INPUT_FILE_OPTION, bands: Optional[List[int]] = None):
     """Compute Shapiro-Wilk test for normality on the input raster data."""
+    import rasterio
+
     from eis_toolkit.exploratory_analyses.normality_test import normality_test_array
 
     typer.echo("Progress: 10%")
@@ -340,10 +345,11 @@ def normality_test_raster_cli(input_raster: INPUT_FILE_OPTION, bands: Optional[L
 def normality_test_vector_cli(input_vector: INPUT_FILE_OPTION, columns: Optional[List[str]] = None):
     """Compute Shapiro-Wilk test for normality on the input vector data."""
     from eis_toolkit.exploratory_analyses.normality_test import normality_test_dataframe
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    geodataframe = gpd.read_file(input_vector)
+    geodataframe = read_vector(input_vector)
     typer.echo("Progress: 25%")
 
     results_dict = normality_test_dataframe(data=geodataframe, columns=columns)
@@ -365,10 +371,11 @@ def chi_square_test_cli(
 ):
     """Perform a Chi-square test of independence between a target variable and one or more other variables."""
     from eis_toolkit.exploratory_analyses.chi_square_test import chi_square_test
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    geodataframe = gpd.read_file(input_vector)  # Should we drop geometry columns?
+    geodataframe = read_vector(input_vector)  # Should we drop geometry columns?
     typer.echo("Progress: 25%")
 
     results_dict = chi_square_test(data=geodataframe, target_column=target_column, columns=columns)
@@ -391,11 +398,14 @@ def correlation_matrix_cli(
     min_periods: Optional[int] = None,
 ):
     """Compute correlation matrix on the input data."""
+    import pandas as pd
+
     from eis_toolkit.exploratory_analyses.correlation_matrix import correlation_matrix
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    geodataframe = gpd.read_file(input_vector)
+    geodataframe = read_vector(input_vector)
     dataframe = pd.DataFrame(geodataframe.drop(columns="geometry"))
     typer.echo("Progress: 25%")
 
@@ -421,11 +431,14 @@ def covariance_matrix_cli(
     delta_degrees_of_freedom: int = 1,
 ):
     """Compute covariance matrix on the input data."""
+    import pandas as pd
+
     from eis_toolkit.exploratory_analyses.covariance_matrix import covariance_matrix
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    geodataframe = gpd.read_file(input_vector)
+    geodataframe = read_vector(input_vector)
     dataframe = pd.DataFrame(geodataframe.drop(columns="geometry"))
     typer.echo("Progress: 25%")
 
@@ -451,10 +464,11 @@ def dbscan_cli(
 ):
     """Perform DBSCAN clustering on the input data."""
     from eis_toolkit.exploratory_analyses.dbscan import dbscan
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    geodataframe = gpd.read_file(input_vector)
+    geodataframe = read_vector(input_vector)
     typer.echo("Progress: 25%")
 
     output_geodataframe = dbscan(data=geodataframe, max_distance=max_distance, min_samples=min_samples)
@@ -476,10 +490,11 @@ def k_means_clustering_cli(
 ):
     """Perform k-means clustering on the input data."""
     from eis_toolkit.exploratory_analyses.k_means_cluster import k_means_clustering
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    geodataframe = gpd.read_file(input_vector)
+    geodataframe = read_vector(input_vector)
     typer.echo("Progress: 25%")
 
     output_geodataframe = k_means_clustering(
@@ -507,11 +522,13 @@ def parallel_coordinates_cli(
 ):
     """Generate a parallel coordinates plot."""
     import matplotlib.pyplot as plt
+    import pandas as pd
 
     from eis_toolkit.exploratory_analyses.parallel_coordinates import plot_parallel_coordinates
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
-    geodataframe = gpd.read_file(input_vector)
+    geodataframe = read_vector(input_vector)
     dataframe = pd.DataFrame(geodataframe.drop(columns="geometry"))
     typer.echo("Progress: 25%")
 
@@ -547,6 +564,9 @@ def compute_pca_raster_cli(
     # NOTE: Omitted nodata parameter. Should use raster nodata.
 ):
     """Compute defined number of principal components for raster data."""
+    import numpy as np
+    import rasterio
+
     from eis_toolkit.exploratory_analyses.pca import compute_pca
     from eis_toolkit.utilities.file_io import read_and_stack_rasters
 
@@ -595,10 +615,11 @@ def compute_pca_vector_cli(
 ):
     """Compute defined number of principal components for vector data."""
     from eis_toolkit.exploratory_analyses.pca import compute_pca
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    gdf = gpd.read_file(input_vector)
+    gdf = read_vector(input_vector)
     typer.echo("Progress: 25%")
 
     pca_gdf, variance_ratios = compute_pca(
@@ -626,6 +647,8 @@ def compute_pca_vector_cli(
 @app.command()
 def descriptive_statistics_raster_cli(input_file: INPUT_FILE_OPTION):
     """Generate descriptive statistics from raster data."""
+    import rasterio
+
     from eis_toolkit.exploratory_analyses.descriptive_statistics import descriptive_statistics_raster
 
     typer.echo("Progress: 10%")
@@ -645,13 +668,16 @@ def descriptive_statistics_raster_cli(input_file: INPUT_FILE_OPTION):
 @app.command()
 def descriptive_statistics_vector_cli(input_file: INPUT_FILE_OPTION, column: str = None):
     """Generate descriptive statistics from vector or tabular data."""
+    import pandas as pd
+
     from eis_toolkit.exploratory_analyses.descriptive_statistics import descriptive_statistics_dataframe
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
     # TODO modify input file detection
     try:
-        gdf = gpd.read_file(input_file)
+        gdf = read_vector(input_file)
         typer.echo("Progress: 25%")
         results_dict = descriptive_statistics_dataframe(gdf, column)
     except:  # noqa: E722
@@ -682,10 +708,11 @@ def local_morans_i_cli(
 ):
     """Execute Local Moran's I calculation for the data."""
     from eis_toolkit.exploratory_analyses.local_morans_i import local_morans_i
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    gdf = gpd.read_file(input_vector)
+    gdf = read_vector(input_vector)
     typer.echo("Progress: 25%")
 
     out_gdf = local_morans_i(gdf, column, get_enum_values(weight_type), k, permutations)
@@ -709,6 +736,8 @@ def focal_filter_cli(
     shape: Annotated[FocalFilterShape, typer.Option(case_sensitive=False)] = FocalFilterShape.circle,
 ):
     """Apply a basic focal filter to the input raster."""
+    import rasterio
+
     from eis_toolkit.raster_processing.filters.focal import focal_filter
 
     typer.echo("Progress: 10%")
@@ -735,6 +764,8 @@ def gaussian_filter_cli(
     size: int = None,
 ):
     """Apply a gaussian filter to the input raster."""
+    import rasterio
+
     from eis_toolkit.raster_processing.filters.focal import gaussian_filter
 
     typer.echo("Progress: 10%")
@@ -764,6 +795,8 @@ def mexican_hat_filter_cli(
     ] = MexicanHatFilterDirection.circular,
 ):
     """Apply a mexican hat filter to the input raster."""
+    import rasterio
+
     from eis_toolkit.raster_processing.filters.focal import mexican_hat_filter
 
     typer.echo("Progress: 10%")
@@ -791,6 +824,8 @@ def lee_additive_noise_filter_cli(
     add_noise_var: float = 0.25,
 ):
     """Apply a Lee filter considering additive noise components in the input raster."""
+    import rasterio
+
     from eis_toolkit.raster_processing.filters.speckle import lee_additive_noise_filter
 
     typer.echo("Progress: 10%")
@@ -817,6 +852,8 @@ def lee_multiplicative_noise_filter_cli(
     n_looks: int = 1,
 ):
     """Apply a Lee filter considering multiplicative noise components in the input raster."""
+    import rasterio
+
     from eis_toolkit.raster_processing.filters.speckle import lee_multiplicative_noise_filter
 
     typer.echo("Progress: 10%")
@@ -846,6 +883,8 @@ def lee_additive_multiplicative_noise_filter_cli(
     multi_noise_mean: float = 1.0,
 ):
     """Apply a Lee filter considering both additive and multiplicative noise components in the input raster."""
+    import rasterio
+
     from eis_toolkit.raster_processing.filters.speckle import lee_additive_multiplicative_noise_filter
 
     typer.echo("Progress: 10%")
@@ -878,6 +917,8 @@ def lee_enhanced_filter_cli(
     damping_factor: float = 1.0,
 ):
     """Apply an enhanced Lee filter to the input raster."""
+    import rasterio
+
     from eis_toolkit.raster_processing.filters.speckle import lee_enhanced_filter
 
     typer.echo("Progress: 10%")
@@ -905,6 +946,8 @@ def gamma_filter_cli(
     n_looks: int = 1,
 ):
     """Apply a Gamma filter to the input raster."""
+    import rasterio
+
     from eis_toolkit.raster_processing.filters.speckle import gamma_filter
 
     typer.echo("Progress: 10%")
@@ -930,6 +973,8 @@ def frost_filter_cli(
     damping_factor: float = 1.0,
 ):
     """Apply a Frost filter to the input raster."""
+    import rasterio
+
     from eis_toolkit.raster_processing.filters.speckle import frost_filter
 
     typer.echo("Progress: 10%")
@@ -955,6 +1000,8 @@ def kuan_filter_cli(
     n_looks: int = 1,
 ):
     """Apply a Kuan filter to the input raster."""
+    import rasterio
+
     from eis_toolkit.raster_processing.filters.speckle import kuan_filter
 
     typer.echo("Progress: 10%")
@@ -975,6 +1022,8 @@ def kuan_filter_cli(
 @app.command()
 def check_raster_grids_cli(input_rasters: INPUT_FILES_ARGUMENT, same_extent: bool = False):
     """Check all input rasters for matching gridding and optionally matching bounds."""
+    import rasterio
+
     from eis_toolkit.utilities.checks.raster import check_raster_grids
 
     typer.echo("Progress: 10%")
@@ -1004,22 +1053,22 @@ def clip_raster_cli(
     output_raster: OUTPUT_FILE_OPTION,
 ):
     """Clip the input raster with geometries in a geodataframe."""
-    from eis_toolkit.raster_processing.clipping import clip_raster
+    import rasterio
+
+    from eis_toolkit.raster_processing.clipping import clip_and_write_raster
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    geodataframe = gpd.read_file(geometries)
+    geodataframe = read_vector(geometries)
 
     with rasterio.open(input_raster) as raster:
         typer.echo("Progress: 25%")
-        out_image, out_meta = clip_raster(
+        clip_and_write_raster(
             raster=raster,
             geodataframe=geodataframe,
+            output_raster=output_raster,
         )
-    typer.echo("Progress: 75%")
-
-    with rasterio.open(output_raster, "w", **out_meta) as dest:
-        dest.write(out_image)
     typer.echo("Progress: 100%")
 
     typer.echo(f"Clipping completed, output raster written to {output_raster}.")
@@ -1049,6 +1098,8 @@ def create_constant_raster_cli(
     - Set extent from origin, based on the western and northern coordinates and the pixel size.
     - Set extent from bounds, based on western, northern, eastern and southern points.
     """
+    import rasterio
+
     from eis_toolkit.raster_processing.create_constant_raster import create_constant_raster
 
     typer.echo("Progress: 10%")
@@ -1102,11 +1153,14 @@ def extract_values_from_raster_cli(
     output_vector: OUTPUT_FILE_OPTION,
 ):
     """Extract raster values using point data to a DataFrame."""
+    import rasterio
+
     from eis_toolkit.raster_processing.extract_values_from_raster import extract_values_from_raster
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    geodataframe = gpd.read_file(geometries)
+    geodataframe = read_vector(geometries)
 
     with rasterio.open(input_raster) as raster:
         typer.echo("Progress: 25%")
@@ -1128,19 +1182,20 @@ def reproject_raster_cli(
     resampling_method: Annotated[ResamplingMethods, typer.Option(case_sensitive=False)] = ResamplingMethods.nearest,
 ):
     """Reproject the input raster to given CRS."""
-    from eis_toolkit.raster_processing.reprojecting import reproject_raster
+    import rasterio
+
+    from eis_toolkit.raster_processing.reprojecting import reproject_and_write_raster
 
     typer.echo("Progress: 10%")
 
     with rasterio.open(input_raster) as raster:
         typer.echo("Progress: 25%")
-        out_image, out_meta = reproject_raster(
-            raster=raster, target_crs=target_crs, resampling_method=get_enum_values(resampling_method)
+        reproject_and_write_raster(
+            raster=raster,
+            target_crs=target_crs,
+            output_raster=output_raster,
+            resampling_method=get_enum_values(resampling_method),
         )
-    typer.echo("Progress: 75%")
-
-    with rasterio.open(output_raster, "w", **out_meta) as dest:
-        dest.write(out_image)
     typer.echo("Progress: 100%")
 
     typer.echo(f"Reprojecting completed, writing raster to {output_raster}.")
@@ -1153,8 +1208,11 @@ def resample_raster_cli(
     output_raster: OUTPUT_FILE_OPTION,
     resolution: float = typer.Option(),
     resampling_method: Annotated[ResamplingMethods, typer.Option(case_sensitive=False)] = ResamplingMethods.bilinear,
+    in_memory: bool = False,
 ):
     """Resamples raster according to given resolution."""
+    import rasterio
+
     from eis_toolkit.raster_processing.resampling import resample
 
     typer.echo("Progress: 10%")
@@ -1162,7 +1220,10 @@ def resample_raster_cli(
     with rasterio.open(input_raster) as raster:
         typer.echo("Progress: 25%")
         out_image, out_meta = resample(
-            raster=raster, resolution=resolution, resampling_method=get_enum_values(resampling_method)
+            raster=raster,
+            resolution=resolution,
+            resampling_method=get_enum_values(resampling_method),
+            in_memory=in_memory,
         )
     typer.echo("Progress: 75%")
 
@@ -1181,7 +1242,10 @@ def snap_raster_cli(
     output_raster: OUTPUT_FILE_OPTION,
 ):
     """Snaps/aligns input raster to the given snap raster."""
+    import rasterio
+
     from eis_toolkit.raster_processing.snapping import snap_with_raster
+    from eis_toolkit.utilities.file_io import write_raster
 
     typer.echo("Progress: 10%")
 
@@ -1190,8 +1254,7 @@ def snap_raster_cli(
         out_image, out_meta = snap_with_raster(src, snap_src)
     typer.echo("Progress: 75%")
 
-    with rasterio.open(output_raster, "w", **out_meta) as dst:
-        dst.write(out_image)
+    write_raster(output_raster, out_image, out_meta)
     typer.echo("Progress: 100%")
 
     typer.echo(f"Snapping completed, writing raster to {output_raster}.")
@@ -1207,6 +1270,8 @@ def unify_rasters_cli(
     same_extent: bool = False,
 ):
     """Unify rasters to match the base raster."""
+    import rasterio
+
     from eis_toolkit.raster_processing.unifying import unify_raster_grids
 
     typer.echo("Progress: 10%")
@@ -1246,6 +1311,8 @@ def unique_combinations_cli(
     output_raster: OUTPUT_FILE_OPTION,
 ):
     """Get combinations of raster values between rasters."""
+    import rasterio
+
     from eis_toolkit.raster_processing.unique_combinations import unique_combinations
 
     typer.echo("Progress: 10%")
@@ -1273,7 +1340,10 @@ def extract_window_cli(
     width: int = typer.Option(),
 ):
     """Extract window from raster."""
+    import rasterio
+
     from eis_toolkit.raster_processing.windowing import extract_window
+    from eis_toolkit.utilities.file_io import write_raster
 
     typer.echo("Progress: 10%")
 
@@ -1282,8 +1352,7 @@ def extract_window_cli(
         out_image, out_meta = extract_window(raster, center_coords, height, width)
     typer.echo("Progress: 75%")
 
-    with rasterio.open(output_raster, "w", **out_meta) as dst:
-        dst.write(out_image)
+    write_raster(output_raster, out_image, out_meta)
     typer.echo("Progress: 100%")
 
     typer.echo(f"Windowing completed, writing raster to {output_raster}")
@@ -1298,6 +1367,8 @@ def classify_aspect_cli(
     num_classes: int = 8,
 ):
     """Classify an aspect raster data set."""
+    import rasterio
+
     from eis_toolkit.raster_processing.derivatives.classification import classify_aspect
 
     typer.echo("Progress: 10%")
@@ -1333,6 +1404,8 @@ def surface_derivatives_cli(
     second_order_method: Annotated[SecondOrderMethod, typer.Option(case_sensitive=False)] = SecondOrderMethod.Young,
 ):
     """Calculate the first and/or second order surface attributes."""
+    import rasterio
+
     from eis_toolkit.raster_processing.derivatives.parameters import first_order, second_order_basic_set
 
     typer.echo("Progress: 10%")
@@ -1386,6 +1459,8 @@ def reclassify_with_manual_breaks_cli(
     bands: Annotated[List[int], typer.Option()] = None,
 ):
     """Classify raster with manual breaks."""
+    import rasterio
+
     from eis_toolkit.raster_processing.reclassify import reclassify_with_manual_breaks
 
     typer.echo("Progress: 10%")
@@ -1410,6 +1485,8 @@ def reclassify_with_defined_intervals_cli(
     bands: Annotated[List[int], typer.Option()] = None,
 ):
     """Classify raster with defined intervals."""
+    import rasterio
+
     from eis_toolkit.raster_processing.reclassify import reclassify_with_defined_intervals
 
     typer.echo("Progress: 10%")
@@ -1434,6 +1511,8 @@ def reclassify_with_equal_intervals_cli(
     bands: Annotated[List[int], typer.Option()] = None,
 ):
     """Classify raster with equal intervals."""
+    import rasterio
+
     from eis_toolkit.raster_processing.reclassify import reclassify_with_equal_intervals
 
     typer.echo("Progress: 10%")
@@ -1460,6 +1539,8 @@ def reclassify_with_quantiles_cli(
     bands: Annotated[List[int], typer.Option()] = None,
 ):
     """Classify raster with quantiles."""
+    import rasterio
+
     from eis_toolkit.raster_processing.reclassify import reclassify_with_quantiles
 
     typer.echo("Progress: 10%")
@@ -1486,6 +1567,8 @@ def reclassify_with_natural_breaks_cli(
     bands: Annotated[List[int], typer.Option()] = None,
 ):
     """Classify raster with natural breaks (Jenks Caspall)."""
+    import rasterio
+
     from eis_toolkit.raster_processing.reclassify import reclassify_with_natural_breaks
 
     typer.echo("Progress: 10%")
@@ -1512,6 +1595,8 @@ def reclassify_with_geometrical_intervals_cli(
     bands: Annotated[List[int], typer.Option()] = None,
 ):
     """Classify raster with geometrical intervals."""
+    import rasterio
+
     from eis_toolkit.raster_processing.reclassify import reclassify_with_geometrical_intervals
 
     typer.echo("Progress: 10%")
@@ -1538,6 +1623,8 @@ def reclassify_with_standard_deviation_cli(
     bands: Annotated[List[int], typer.Option()] = None,
 ):
     """Classify raster with standard deviation."""
+    import rasterio
+
     from eis_toolkit.raster_processing.reclassify import reclassify_with_standard_deviation
 
     typer.echo("Progress: 10%")
@@ -1563,11 +1650,12 @@ def reclassify_with_standard_deviation_cli(
 @app.command()
 def calculate_geometry_cli(input_vector: INPUT_FILE_OPTION, output_vector: OUTPUT_FILE_OPTION):
     """Calculate the length or area of the given geometries."""
+    from eis_toolkit.utilities.file_io import read_vector
     from eis_toolkit.vector_processing.calculate_geometry import calculate_geometry
 
     typer.echo("Progress: 10%")
 
-    geodataframe = gpd.read_file(input_vector)
+    geodataframe = read_vector(input_vector)
     typer.echo("Progress: 25%")
 
     out_vector = calculate_geometry(geodataframe=geodataframe)
@@ -1582,11 +1670,12 @@ def calculate_geometry_cli(input_vector: INPUT_FILE_OPTION, output_vector: OUTPU
 @app.command()
 def extract_shared_lines_cli(input_vector: INPUT_FILE_OPTION, output_vector: OUTPUT_FILE_OPTION):
     """Extract shared lines/borders/edges between polygons."""
+    from eis_toolkit.utilities.file_io import read_vector
     from eis_toolkit.vector_processing.extract_shared_lines import extract_shared_lines
 
     typer.echo("Progress: 10%")
 
-    polygons = gpd.read_file(input_vector)
+    polygons = read_vector(input_vector)
     typer.echo("Progress: 25%")
 
     out_vector = extract_shared_lines(polygons=polygons)
@@ -1608,6 +1697,9 @@ def idw_interpolation_cli(
     extent: Tuple[float, float, float, float] = (None, None, None, None),  # TODO Change this
 ):
     """Apply inverse distance weighting (IDW) interpolation to input vector file."""
+    import rasterio
+
+    from eis_toolkit.utilities.file_io import read_vector
     from eis_toolkit.vector_processing.idw_interpolation import idw
 
     typer.echo("Progress: 10%")
@@ -1615,7 +1707,7 @@ def idw_interpolation_cli(
     if extent == (None, None, None, None):
         extent = None
 
-    geodataframe = gpd.read_file(input_vector)
+    geodataframe = read_vector(input_vector)
     typer.echo("Progress: 25%")
 
     out_image, out_meta = idw(
@@ -1653,8 +1745,12 @@ def kriging_interpolation_cli(
     variogram_model: Annotated[VariogramModel, typer.Option(case_sensitive=False)] = VariogramModel.linear,
     coordinates_type: Annotated[CoordinatesType, typer.Option(case_sensitive=False)] = CoordinatesType.geographic,
     method: Annotated[KrigingMethod, typer.Option(case_sensitive=False)] = KrigingMethod.ordinary,
+    device: Annotated[KrigingDevice, typer.Option(case_sensitive=False)] = KrigingDevice.cpu,
 ):
     """Apply kriging interpolation to input vector file."""
+    import rasterio
+
+    from eis_toolkit.utilities.file_io import read_vector
     from eis_toolkit.vector_processing.kriging_interpolation import kriging
 
     typer.echo("Progress: 10%")
@@ -1662,7 +1758,7 @@ def kriging_interpolation_cli(
     if extent == (None, None, None, None):
         extent = None
 
-    geodataframe = gpd.read_file(input_vector)
+    geodataframe = read_vector(input_vector)
     typer.echo("Progress: 25%")
 
     out_image, out_meta = kriging(
@@ -1673,6 +1769,7 @@ def kriging_interpolation_cli(
         variogram_model=get_enum_values(variogram_model),
         coordinates_type=get_enum_values(coordinates_type),
         method=get_enum_values(method),
+        device=get_enum_values(device),
     )
     typer.echo("Progress: 75%")
 
@@ -1709,11 +1806,14 @@ def rasterize_cli(
 
     Either resolution or base-raster-profile-raster must be provided.
     """
+    import rasterio
+
+    from eis_toolkit.utilities.file_io import read_vector, write_raster
     from eis_toolkit.vector_processing.rasterize_vector import rasterize_vector
 
     typer.echo("Progress: 10%")
 
-    geodataframe = gpd.read_file(input_vector)
+    geodataframe = read_vector(input_vector)
 
     if base_raster_profile_raster is not None:
         with rasterio.open(base_raster_profile_raster) as raster:
@@ -1741,9 +1841,7 @@ def rasterize_cli(
         }
     )
 
-    with rasterio.open(output_raster, "w", **out_meta) as dst:
-        for band_n in range(1, out_meta["count"]):
-            dst.write(out_image, band_n)
+    write_raster(output_raster, out_image, out_meta)
     typer.echo("Progress: 100%")
 
     typer.echo(f"Rasterizing completed, writing raster to {output_raster}.")
@@ -1757,11 +1855,12 @@ def reproject_vector_cli(
     target_crs: int = typer.Option(help="crs help"),
 ):
     """Reproject the input vector to given CRS."""
+    from eis_toolkit.utilities.file_io import read_vector
     from eis_toolkit.vector_processing.reproject_vector import reproject_vector
 
     typer.echo("Progress: 10%")
 
-    geodataframe = gpd.read_file(input_vector)
+    geodataframe = read_vector(input_vector)
     typer.echo("Progress: 25%")
 
     reprojected_geodataframe = reproject_vector(geodataframe=geodataframe, target_crs=target_crs)
@@ -1788,11 +1887,14 @@ def vector_density_cli(
 
     Either resolution or base_raster_profile_raster must be provided.
     """
+    import rasterio
+
+    from eis_toolkit.utilities.file_io import read_vector
     from eis_toolkit.vector_processing.vector_density import vector_density
 
     typer.echo("Progress: 10%")
 
-    geodataframe = gpd.read_file(input_vector)
+    geodataframe = read_vector(input_vector)
 
     if base_raster_profile_raster is not None:
         with rasterio.open(base_raster_profile_raster) as raster:
@@ -1833,6 +1935,9 @@ def distance_computation_cli(
     output_raster: OUTPUT_FILE_OPTION,
 ):
     """Calculate distance from raster cell to nearest geometry."""
+    import rasterio
+
+    from eis_toolkit.utilities.file_io import read_vector
     from eis_toolkit.vector_processing.distance_computation import distance_computation
 
     typer.echo("Progress: 10%")
@@ -1840,7 +1945,7 @@ def distance_computation_cli(
     with rasterio.open(input_raster) as raster:
         profile = raster.profile
 
-    geodataframe = gpd.read_file(geometries)
+    geodataframe = read_vector(geometries)
     typer.echo("Progress: 25%")
 
     out_image = distance_computation(profile, geodataframe)
@@ -2154,6 +2259,8 @@ def evaluate_trained_model_cli(
     validation_metrics: Annotated[List[str], typer.Option()],
 ):
     """Train and optionally validate a Gradient boosting regressor model using Sklearn."""
+    import rasterio
+
     from eis_toolkit.prediction.machine_learning_general import (
         evaluate_model,
         load_model,
@@ -2195,6 +2302,8 @@ def predict_with_trained_model_cli(
     output_raster: OUTPUT_FILE_OPTION,
 ):
     """Train and optionally validate a Gradient boosting regressor model using Sklearn."""
+    import rasterio
+
     from eis_toolkit.prediction.machine_learning_general import (
         load_model,
         predict,
@@ -2233,6 +2342,8 @@ def and_overlay_cli(
     output_raster: OUTPUT_FILE_OPTION,
 ):
     """Compute an 'and' overlay operation with fuzzy logic."""
+    import rasterio
+
     from eis_toolkit.prediction.fuzzy_overlay import and_overlay
     from eis_toolkit.utilities.file_io import read_and_stack_rasters
 
@@ -2261,6 +2372,8 @@ def or_overlay_cli(
     output_raster: OUTPUT_FILE_OPTION,
 ):
     """Compute an 'or' overlay operation with fuzzy logic."""
+    import rasterio
+
     from eis_toolkit.prediction.fuzzy_overlay import or_overlay
     from eis_toolkit.utilities.file_io import read_and_stack_rasters
 
@@ -2289,6 +2402,8 @@ def product_overlay_cli(
     output_raster: OUTPUT_FILE_OPTION,
 ):
     """Compute an 'product' overlay operation with fuzzy logic."""
+    import rasterio
+
     from eis_toolkit.prediction.fuzzy_overlay import product_overlay
     from eis_toolkit.utilities.file_io import read_and_stack_rasters
 
@@ -2317,6 +2432,8 @@ def sum_overlay_cli(
     output_raster: OUTPUT_FILE_OPTION,
 ):
     """Compute an 'sum' overlay operation with fuzzy logic."""
+    import rasterio
+
     from eis_toolkit.prediction.fuzzy_overlay import sum_overlay
     from eis_toolkit.utilities.file_io import read_and_stack_rasters
 
@@ -2342,6 +2459,8 @@ def sum_overlay_cli(
 @app.command()
 def gamma_overlay_cli(input_rasters: INPUT_FILES_ARGUMENT, output_raster: OUTPUT_FILE_OPTION, gamma: float = 0.5):
     """Compute an 'gamma' overlay operation with fuzzy logic."""
+    import rasterio
+
     from eis_toolkit.prediction.fuzzy_overlay import gamma_overlay
     from eis_toolkit.utilities.file_io import read_and_stack_rasters
 
@@ -2379,11 +2498,15 @@ def alr_transform_cli(
     keep_denominator_column: bool = False,
 ):
     """Perform an additive logratio transformation on the data."""
+    import geopandas as gpd
+    import pandas as pd
+
     from eis_toolkit.transformations.coda.alr import alr_transform
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    gdf = gpd.read_file(input_vector)
+    gdf = read_vector(input_vector)
     geometries = gdf["geometry"]
     df = pd.DataFrame(gdf.drop(columns="geometry"))
     typer.echo("Progress: 25%")
@@ -2406,11 +2529,15 @@ def inverse_alr_transform_cli(
     scale: float = 1.0,
 ):
     """Perform the inverse transformation for a set of ALR transformed data."""
+    import geopandas as gpd
+    import pandas as pd
+
     from eis_toolkit.transformations.coda.alr import inverse_alr
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    gdf = gpd.read_file(input_vector)
+    gdf = read_vector(input_vector)
     geometries = gdf["geometry"]
     df = pd.DataFrame(gdf.drop(columns="geometry"))
     typer.echo("Progress: 25%")
@@ -2428,11 +2555,15 @@ def inverse_alr_transform_cli(
 @app.command()
 def clr_transform_cli(input_vector: INPUT_FILE_OPTION, output_vector: OUTPUT_FILE_OPTION):
     """Perform a centered logratio transformation on the data."""
+    import geopandas as gpd
+    import pandas as pd
+
     from eis_toolkit.transformations.coda.clr import clr_transform
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    gdf = gpd.read_file(input_vector)
+    gdf = read_vector(input_vector)
     geometries = gdf["geometry"]
     df = pd.DataFrame(gdf.drop(columns="geometry"))
     typer.echo("Progress: 25%")
@@ -2455,11 +2586,15 @@ def inverse_clr_transform_cli(
     scale: float = 1.0,
 ):
     """Perform the inverse transformation for a set of CLR transformed data."""
+    import geopandas as gpd
+    import pandas as pd
+
     from eis_toolkit.transformations.coda.clr import inverse_clr
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    gdf = gpd.read_file(input_vector)
+    gdf = read_vector(input_vector)
     geometries = gdf["geometry"]
     df = pd.DataFrame(gdf.drop(columns="geometry"))
     typer.echo("Progress: 25%")
@@ -2482,11 +2617,15 @@ def single_ilr_transform_cli(
     subcomposition_2: Annotated[List[str], typer.Option()],
 ):
     """Perform a single isometric logratio transformation on the provided subcompositions."""
+    import geopandas as gpd
+    import pandas as pd
+
     from eis_toolkit.transformations.coda.ilr import single_ilr_transform
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    gdf = gpd.read_file(input_vector)
+    gdf = read_vector(input_vector)
     geometries = gdf["geometry"]
     df = pd.DataFrame(gdf.drop(columns="geometry"))
     typer.echo("Progress: 25%")
@@ -2511,11 +2650,15 @@ def pairwise_logratio_cli(
     denominator_column: str = typer.Option(),
 ):
     """Perform a pairwise logratio transformation on the given columns."""
+    import geopandas as gpd
+    import pandas as pd
+
     from eis_toolkit.transformations.coda.pairwise import pairwise_logratio
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    gdf = gpd.read_file(input_vector)
+    gdf = read_vector(input_vector)
     geometries = gdf["geometry"]
     df = pd.DataFrame(gdf.drop(columns="geometry"))
     typer.echo("Progress: 25%")
@@ -2539,11 +2682,15 @@ def single_plr_transform_cli(
     column: str = typer.Option(),
 ):
     """Perform a pivot logratio transformation on the selected column."""
+    import geopandas as gpd
+    import pandas as pd
+
     from eis_toolkit.transformations.coda.plr import single_plr_transform
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    gdf = gpd.read_file(input_vector)
+    gdf = read_vector(input_vector)
     geometries = gdf["geometry"]
     df = pd.DataFrame(gdf.drop(columns="geometry"))
     typer.echo("Progress: 25%")
@@ -2563,11 +2710,15 @@ def single_plr_transform_cli(
 @app.command()
 def plr_transform_cli(input_vector: INPUT_FILE_OPTION, output_vector: OUTPUT_FILE_OPTION):
     """Perform a pivot logratio transformation on the dataframe, returning the full set of transforms."""
+    import geopandas as gpd
+    import pandas as pd
+
     from eis_toolkit.transformations.coda.plr import plr_transform
+    from eis_toolkit.utilities.file_io import read_vector
 
     typer.echo("Progress: 10%")
 
-    gdf = gpd.read_file(input_vector)
+    gdf = read_vector(input_vector)
     geometries = gdf["geometry"]
     df = pd.DataFrame(gdf.drop(columns="geometry"))
     typer.echo("Progress: 25%")
@@ -2594,6 +2745,8 @@ def binarize_cli(
     Replaces values less or equal threshold with 0.
     Replaces values greater than the threshold with 1.
     """
+    import rasterio
+
     from eis_toolkit.transformations.binarize import binarize
 
     typer.echo("Progress: 10%")
@@ -2624,6 +2777,8 @@ def clip_transform_cli(
     Replaces values below the lower limit and above the upper limit with provided values, respecively.
     Works both one-sided and two-sided but raises error if no limits provided.
     """
+    import rasterio
+
     from eis_toolkit.transformations.clip import clip_transform
 
     typer.echo("Progress: 10%")
@@ -2651,6 +2806,8 @@ def z_score_normalization_cli(
 
     Results will have a mean = 0 and standard deviation = 1.
     """
+    import rasterio
+
     from eis_toolkit.transformations.linear import z_score_normalization
 
     typer.echo("Progress: 10%")
@@ -2680,6 +2837,8 @@ def min_max_scaling_cli(
 
     Uses the provided new minimum and maximum to transform data into the new interval.
     """
+    import rasterio
+
     from eis_toolkit.transformations.linear import min_max_scaling
 
     typer.echo("Progress: 10%")
@@ -2709,6 +2868,8 @@ def log_transform_cli(
     Logarithm base can be "ln", "log" or "log10".
     Negative values will not be considered for transformation and replaced by the specific nodata value.
     """
+    import rasterio
+
     from eis_toolkit.transformations.logarithmic import log_transform
 
     typer.echo("Progress: 10%")
@@ -2740,6 +2901,8 @@ def sigmoid_transform_cli(
 
     Uses the provided new minimum and maximum, shift and slope parameters to transform the data.
     """
+    import rasterio
+
     from eis_toolkit.transformations.sigmoid import sigmoid_transform
 
     typer.echo("Progress: 10%")
@@ -2783,6 +2946,8 @@ def winsorize_transform_cli(
     percentiles are (5, 35) for inside and (10, 30) for outside.
     This results in [5 10 12 15 20 24 27 30 35] and [10 10 12 15 20 24 27 30 30], respectively.
     """
+    import rasterio
+
     from eis_toolkit.transformations.winsorize import winsorize
 
     typer.echo("Progress: 10%")
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from beartype import beartype
 from beartype.typing import Dict, Optional, Sequence
@@ -37,15 +38,27 @@ def chi_square_test(
         raise InvalidParameterValueException("Target column not found in the Dataframe.")
 
     if columns:
-        invalid_columns = [column for column in columns if column not in data.columns]
+        invalid_columns = pd.Index(columns).difference(data.columns, sort=False).to_list()
         if invalid_columns:
             raise InvalidParameterValueException(f"Invalid columns: {invalid_columns}")
     else:
         columns = [col for col in data.columns if col != target_column]
 
+    target_codes, target_categories = pd.factorize(data[target_column])
+
     statistics = {}
     for column in columns:
-        contingency_table = pd.crosstab(data[target_column], data[column])
+        column_codes, column_categories = pd.factorize(data[column])
+
+        # Rows with missing values in either column are left out, like pd.crosstab does
+        valid = (target_codes >= 0) & (column_codes >= 0)
+        n_column_categories = len(column_categories)
+        contingency_table = np.bincount(
+            target_codes[valid] * n_column_categories + column_codes[valid],
+            minlength=len(target_categories) * n_column_categories,
+        ).reshape(len(target_categories), n_column_categories)
+        contingency_table = contingency_table[contingency_table.any(axis=1)][:, contingency_table.any(axis=0)]
+
         chi_square, p_value, degrees_of_freedom, _ = chi2_contingency(contingency_table)
         statistics[column] = {"chi_square": chi_square, "p-value": p_value, "degrees_of_freedom": degrees_of_freedom}
 
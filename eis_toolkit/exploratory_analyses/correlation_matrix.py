@@ -4,7 +4,7 @@ from beartype import beartype
 from beartype.typing import Literal, Optional, Sequence
 
 from eis_toolkit.exceptions import EmptyDataFrameException, InvalidParameterValueException, NonNumericDataException
-from eis_toolkit.utilities.checks.dataframe import check_empty_dataframe
+from eis_toolkit.utilities.checks.dataframe import check_columns_numeric, check_empty_dataframe
 
 
 @beartype
@@ -37,21 +37,34 @@ def correlation_matrix(
         raise EmptyDataFrameException("The input Dataframe is empty.")
 
     if columns:
-        invalid_columns = [column for column in columns if column not in data.columns]
+        invalid_columns = pd.Index(columns).difference(data.columns, sort=False).to_list()
         if invalid_columns:
             raise InvalidParameterValueException(f"Invalid columns: {invalid_columns}")
+        if not check_columns_numeric(data, columns):
+            raise NonNumericDataException("The input data contain non-numeric data.")
         data_subset = data[columns]
     else:
         data_subset = data.select_dtypes(include=np.number)
 
-    if not all(data_subset.dtypes.apply(lambda x: np.issubdtype(x, np.number))):
-        raise NonNumericDataException("The input data contain non-numeric data.")
-
     if correlation_method == "kendall" and min_periods is not None:
         raise InvalidParameterValueException(
             "The argument min_periods is available only with correlation methods 'pearson' and 'spearman'."
         )
 
+    # Without missing values, Pearson correlation of all column pairs is computed at once with NumPy. Other dtypes,
+    # such as timedeltas that pandas excludes from the correlation, are left to pandas
+    if (
+        correlation_method == "pearson"
+        and min_periods is None
+        and data_subset.shape[0] > 1
+        and data_subset.shape[1] > 0
+        and all(isinstance(dtype, np.dtype) and dtype.kind in "biuf" for dtype in data_subset.dtypes)
+        and not data_subset.isna().any().any()
+    ):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coefficients = np.corrcoef(data_subset.to_numpy(dtype=np.float64), rowvar=False)
+        return pd.DataFrame(np.atleast_2d(coefficients), index=data_subset.columns, columns=data_subset.columns)
+
     matrix = data_subset.corr(method=correlation_method, min_periods=min_periods, numeric_only=True)
 
     return matrix
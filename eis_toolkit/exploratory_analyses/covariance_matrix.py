@@ -4,7 +4,7 @@ from beartype import beartype
 from beartype.typing import Optional, Sequence
 
 from eis_toolkit.exceptions import EmptyDataFrameException, InvalidParameterValueException, NonNumericDataException
-from eis_toolkit.utilities.checks.dataframe import check_empty_dataframe
+from eis_toolkit.utilities.checks.dataframe import check_columns_numeric, check_empty_dataframe
 
 
 @beartype
@@ -36,22 +36,31 @@ def covariance_matrix(
         raise EmptyDataFrameException("The input Dataframe is empty.")
 
     if columns:
-        invalid_columns = [column for column in columns if column not in data.columns]
+        invalid_columns = pd.Index(columns).difference(data.columns, sort=False).to_list()
         if invalid_columns:
             raise InvalidParameterValueException(f"Invalid columns: {invalid_columns}")
+        if not check_columns_numeric(data, columns):
+            raise NonNumericDataException("The input data contain non-numeric data.")
         data_subset = data[columns]
     else:
         data_subset = data.select_dtypes(include=np.number)
 
-    if not all(data_subset.dtypes.apply(lambda x: np.issubdtype(x, np.number))):
-        raise NonNumericDataException("The input data contain non-numeric data.")
-
     if delta_degrees_of_freedom < 0:
         raise InvalidParameterValueException("Delta degrees of freedom must be non-negative.")
 
     if min_periods and min_periods < 0:
         raise InvalidParameterValueException("Min perioids must be non-negative.")
 
+    # Without missing values, covariance of all column pairs is computed at once with NumPy
+    if (
+        min_periods is None
+        and data_subset.shape[0] > delta_degrees_of_freedom
+        and data_subset.shape[1] > 0
+        and not data_subset.isna().any().any()
+    ):
+        covariances = np.cov(data_subset.to_numpy(dtype=np.float64), rowvar=False, ddof=delta_degrees_of_freedom)
+        return pd.DataFrame(np.atleast_2d(covariances), index=data_subset.columns, columns=data_subset.columns)
+
     matrix = data_subset.cov(min_periods=min_periods, ddof=delta_degrees_of_freedom)
 
     return matrix
@@ -47,19 +47,26 @@ def normality_test_dataframe(
             raise InvalidColumnException("All selected columns were not found in the input DataFrame.")
         if not check_columns_numeric(data, columns):
             raise NonNumericDataException("The selected columns contain non-numeric data.")
-
-        data = data[columns].dropna()
+        drop_missing = True
 
     else:
         columns = data.select_dtypes(include=[np.number]).columns
         if len(columns) == 0:
             raise NonNumericDataException("No numeric columns were found.")
+        drop_missing = False
+
+    # Convert the selected columns once into an array, transposed to iterate over the columns
+    data_array = data[columns].to_numpy(dtype=np.float64, na_value=np.nan).T
+    if drop_missing:
+        data_array = data_array[:, ~np.isnan(data_array).any(axis=0)]
+
+    sample_size = data_array.shape[1]
+    if sample_size > 5000:
+        raise SampleSizeExceededException(f"Sample size {sample_size} exceeds the limit of 5000 samples.")
 
     statistics = {}
-    for column in columns:
-        if len(data[column]) > 5000:
-            raise SampleSizeExceededException(f"Sample size for column '{column}' exceeds the limit of 5000 samples.")
-        stat, p_value = shapiro(data[column])
+    for column, column_data in zip(columns, data_array):
+        stat, p_value = shapiro(column_data)
         statistics[column] = {"Statistic": stat, "p-value": p_value}
 
     return statistics
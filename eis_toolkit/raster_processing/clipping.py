@@ -1,13 +1,19 @@
+from pathlib import Path
+
 import geopandas
 import numpy as np
 import rasterio
 from beartype import beartype
-from beartype.typing import Sequence, Tuple
+from beartype.typing import Sequence, Tuple, Union
+from rasterio.features import geometry_mask, geometry_window
 from rasterio.mask import mask
+from rasterio.windows import Window
+from shapely.geometry import box
 
 from eis_toolkit.exceptions import GeometryTypeException, NonMatchingCrsException
 from eis_toolkit.utilities.checks.geometry import check_geometry_types
 from eis_toolkit.utilities.checks.raster import check_matching_crs
+from eis_toolkit.utilities.file_io import aggregated_windows
 
 
 # The core clipping functionality. Used internally by clip.
@@ -21,6 +27,72 @@ def _clip_raster(raster: rasterio.io.DatasetReader, geometries: Sequence) -> Tup
     return out_image, out_meta
 
 
+# Approximate amount of raster data (in bytes) processed at once by windowed clipping
+WINDOW_MEMORY_BUDGET = 16 * 1024 * 1024
+
+
+# The core windowed clipping functionality. Used internally by clip_and_write_raster.
+def _clip_and_write_raster(
+    raster: rasterio.io.DatasetReader, geometries: geopandas.GeoSeries, output_raster: Union[str, Path]
+) -> dict:
+    crop_window = geometry_window(raster, geometries)
+    nodata = raster.nodata if raster.nodata is not None else 0
+
+    out_meta = raster.meta.copy()
+    out_meta.update(
+        {
+            "driver": "GTiff",
+            "height": int(crop_window.height),
+            "width": int(crop_window.width),
+            "transform": raster.window_transform(crop_window),
+        }
+    )
+
+    with rasterio.open(output_raster, "w", **out_meta) as dst:
+        block_height, block_width = dst.block_shapes[0]
+        block_size = block_height * block_width * dst.count * np.dtype(dst.dtypes[0]).itemsize
+        blocks_per_window = max(WINDOW_MEMORY_BUDGET // block_size, 1)
+
+        for window in aggregated_windows(dst, blocks_per_window):
+            src_window = Window(
+                crop_window.col_off + window.col_off, crop_window.row_off + window.row_off, window.width, window.height
+            )
+            out_block = raster.read(window=src_window)
+
+            # Only the geometries intersecting the window can touch its pixels
+            window_geometries = geometries.iloc[
+                geometries.sindex.query(box(*dst.window_bounds(window)), predicate="intersects")
+            ]
+            if window_geometries.empty:
+                out_block.fill(nodata)
+            else:
+                # Pixels touched by the geometries exactly on their edges can be rasterized differently
+                # than with a single mask for the whole raster due to floating point precision
+                outside_geometries = geometry_mask(
+                    window_geometries,
+                    out_shape=(window.height, window.width),
+                    transform=dst.window_transform(window),
+                    all_touched=True,
+                )
+                out_block[:, outside_geometries] = nodata
+            dst.write(out_block, window=window)
+
+    return out_meta
+
+
+def _check_clip_inputs(raster: rasterio.io.DatasetReader, geometries: geopandas.GeoSeries) -> None:
+    if not check_matching_crs(
+        objects=[raster, geometries],
+    ):
+        raise NonMatchingCrsException("The raster and geodataframe are not in the same CRS.")
+
+    if not check_geometry_types(
+        geometries=geometries,
+        allowed_types=["Polygon", "MultiPolygon"],
+    ):
+        raise GeometryTypeException("The input geometries contain non-polygon features.")
+
+
 @beartype
 def clip_raster(raster: rasterio.io.DatasetReader, geodataframe: geopandas.GeoDataFrame) -> Tuple[np.ndarray, dict]:
     """Clips a raster with polygon geometries.
@@ -39,17 +111,7 @@ def clip_raster(raster: rasterio.io.DatasetReader, geodataframe: geopandas.GeoDa
         GeometryTypeException: The input geometries contain non-polygon features.
     """
     geometries = geodataframe["geometry"]
-
-    if not check_matching_crs(
-        objects=[raster, geometries],
-    ):
-        raise NonMatchingCrsException("The raster and geodataframe are not in the same CRS.")
-
-    if not check_geometry_types(
-        geometries=geometries,
-        allowed_types=["Polygon", "MultiPolygon"],
-    ):
-        raise GeometryTypeException("The input geometries contain non-polygon features.")
+    _check_clip_inputs(raster, geometries)
 
     out_image, out_meta = _clip_raster(
         raster=raster,
@@ -57,3 +119,37 @@ def clip_raster(raster: rasterio.io.DatasetReader, geodataframe: geopandas.GeoDa
     )
 
     return out_image, out_meta
+
+
+@beartype
+def clip_and_write_raster(
+    raster: rasterio.io.DatasetReader, geodataframe: geopandas.GeoDataFrame, output_raster: Union[str, Path]
+) -> dict:
+    """Clips a raster with polygon geometries and writes the result to a file window by window.
+
+    Produces the same output as clip_raster, but reads, clips and writes the raster in blocks
+    so the whole clipped raster is never held in memory. Use this for large rasters.
+
+    Args:
+        raster: The raster to be clipped.
+        geodataframe: A geodataframe containing the geometries to do the clipping with.
+            Should contain only polygon features.
+        output_raster: Path of the output raster file.
+
+    Returns:
+        The metadata of the written raster.
+
+    Raises:
+        NonMatchingCrsException: The raster and geodataframe are not in the same CRS.
+        GeometryTypeException: The input geometries contain non-polygon features.
+    """
+    geometries = geodataframe["geometry"]
+    _check_clip_inputs(raster, geometries)
+
+    out_meta = _clip_and_write_raster(
+        raster=raster,
+        geometries=geometries,
+        output_raster=output_raster,
+    )
+
+    return out_meta
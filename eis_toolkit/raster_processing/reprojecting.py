@@ -1,11 +1,18 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+
 import numpy as np
 import rasterio
 from beartype import beartype
-from beartype.typing import Literal, Tuple
-from rasterio import warp
+from beartype.typing import Iterator, Literal, Optional, Tuple, Union
+from rasterio import Affine, warp
+from rasterio.vrt import WarpedVRT
+from rasterio.windows import Window
 
-from eis_toolkit.exceptions import MatchingCrsException
-from eis_toolkit.raster_processing.resampling import RESAMPLE_METHOD_MAP
+from eis_toolkit.exceptions import MatchingCrsException, NumericValueSignException
 
 
 # Core reprojecting functionality used internally by reproject_raster and reproject_and_write_raster
@@ -53,6 +60,98 @@ def _reproject_raster(
     return out_image, out_meta
 
 
+def _warped_vrt(
+    raster: rasterio.io.DatasetReader,
+    dst_crs: rasterio.crs.CRS,
+    dst_transform: Affine,
+    dst_width: int,
+    dst_height: int,
+    resampling_method: warp.Resampling,
+) -> WarpedVRT:
+    # GDAL scales the resampling kernels by the ratio of destination to source pixels, which it otherwise estimates
+    # separately for each warped chunk. The ratio of the whole raster is used for every chunk instead
+    return WarpedVRT(
+        raster,
+        crs=dst_crs,
+        transform=dst_transform,
+        width=dst_width,
+        height=dst_height,
+        resampling=resampling_method,
+        nodata=raster.meta["nodata"],
+        XSCALE=dst_width / raster.width,
+        YSCALE=dst_height / raster.height,
+    )
+
+
+def _block_row_windows(vrt: WarpedVRT) -> Iterator[Window]:
+    # The warped raster is computed in blocks, so each window covers a full row of blocks to warp every block once
+    block_height = vrt.block_shapes[0][0]
+    for row_off in range(0, vrt.height, block_height):
+        yield Window(0, row_off, vrt.width, min(block_height, vrt.height - row_off))
+
+
+# Windowed reprojecting functionality used internally by reproject_and_write_raster
+def _reproject_and_write_raster(
+    raster: rasterio.io.DatasetReader,
+    target_crs: int,
+    resampling_method: warp.Resampling,
+    output_raster: Union[str, Path],
+    max_workers: int,
+    gdal_cache_max: Optional[int],
+) -> dict:
+
+    dst_crs = rasterio.crs.CRS.from_epsg(target_crs)
+
+    dst_transform, dst_width, dst_height = warp.calculate_default_transform(
+        raster.crs,
+        dst_crs,
+        raster.width,
+        raster.height,
+        *raster.bounds,
+    )
+
+    out_meta = raster.meta.copy()
+    out_meta.update(
+        {
+            "crs": dst_crs,
+            "transform": dst_transform,
+            "width": dst_width,
+            "height": dst_height,
+        }
+    )
+
+    # Datasets are not thread-safe, so each worker warps with its own dataset handle and writing is serialized.
+    # GDAL computes the source window of each output window, including the neighbourhood the resampling needs
+    write_lock = threading.Lock()
+    env_options = {} if gdal_cache_max is None else {"GDAL_CACHEMAX": gdal_cache_max}
+
+    with rasterio.Env(**env_options), ExitStack() as stack:
+        vrts = queue.SimpleQueue()
+        for _ in range(max_workers):
+            src = stack.enter_context(rasterio.open(raster.name))
+            vrt = stack.enter_context(
+                _warped_vrt(src, dst_crs, dst_transform, dst_width, dst_height, resampling_method)
+            )
+            vrts.put(vrt)
+        dst = stack.enter_context(rasterio.open(output_raster, "w", **out_meta))
+
+        def process(window: Window) -> None:
+            vrt = vrts.get()
+            try:
+                out_block = vrt.read(window=window)
+            finally:
+                vrts.put(vrt)
+
+            with write_lock:
+                dst.write(out_block, window=window)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results to propagate possible exceptions
+            list(executor.map(process, _block_row_windows(vrt)))
+
+    return out_meta
+
+
 @beartype
 def reproject_raster(
     raster: rasterio.io.DatasetReader,
@@ -77,7 +176,50 @@ def reproject_raster(
     if target_crs == int(raster.crs.to_string()[5:]):
         raise MatchingCrsException("Raster is already in the target CRS.")
 
-    method = RESAMPLE_METHOD_MAP[resampling_method]
+    method = warp.Resampling[resampling_method]
     out_image, out_meta = _reproject_raster(raster, target_crs, method)
 
     return out_image, out_meta
+
+
+@beartype
+def reproject_and_write_raster(
+    raster: rasterio.io.DatasetReader,
+    target_crs: int,
+    output_raster: Union[str, Path],
+    resampling_method: Literal["nearest", "bilinear", "cubic", "average", "gauss", "max", "min"] = "nearest",
+    max_workers: int = 3,
+    gdal_cache_max: Optional[int] = None,
+) -> dict:
+    """Reprojects raster to match given coordinate reference system (EPSG) and writes it to a file window by window.
+
+    The output raster is processed in windows, so the whole raster is never held in memory. Reading,
+    reprojecting and writing of different windows are overlapped using multiple threads.
+
+    Args:
+        raster: The raster to be reprojected.
+        target_crs: Target CRS as EPSG code.
+        output_raster: Path of the output raster file.
+        resampling_method: Resampling method. Most suitable method depends on the dataset and context.
+            Nearest, bilinear and cubic are some common choices. This parameter defaults to nearest.
+        max_workers: Maximum number of threads used. Defaults to 3.
+        gdal_cache_max: GDAL block cache size in megabytes used while reprojecting. Defaults to None,
+            in which case GDAL's configured cache size (GDAL_CACHEMAX) is used.
+
+    Returns:
+        The metadata of the written raster.
+
+    Raises:
+        NonMatchinCrsException: Raster is already in the target CRS.
+        NumericValueSignException: Max workers is not a positive value.
+    """
+    if target_crs == int(raster.crs.to_string()[5:]):
+        raise MatchingCrsException("Raster is already in the target CRS.")
+
+    if max_workers <= 0:
+        raise NumericValueSignException(f"Expected a positive value for max_workers: {max_workers}")
+
+    method = warp.Resampling[resampling_method]
+    out_meta = _reproject_and_write_raster(raster, target_crs, method, output_raster, max_workers, gdal_cache_max)
+
+    return out_meta
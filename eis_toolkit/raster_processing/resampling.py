@@ -4,24 +4,74 @@ import numpy as np
 import rasterio
 from beartype import beartype
 from beartype.typing import Literal, Tuple
+from numba import njit, prange
 from rasterio import warp
 from rasterio.enums import Resampling
 
 from eis_toolkit.exceptions import NumericValueSignException
 
-RESAMPLE_METHOD_MAP = {
-    "nearest": warp.Resampling.nearest,
-    "bilinear": warp.Resampling.bilinear,
-    "cubic": warp.Resampling.cubic,
-    "average": warp.Resampling.average,
-    "gauss": warp.Resampling.gauss,
-    "max": warp.Resampling.max,
-    "min": warp.Resampling.min,
-}
+# Resampling methods that have an in-memory implementation
+IN_MEMORY_RESAMPLE_METHODS = (warp.Resampling.nearest, warp.Resampling.bilinear)
+
+
+@njit(parallel=True, cache=True)
+def _nearest_resample(data: np.ndarray, out_height: int, out_width: int, scale_y: float, scale_x: float) -> np.ndarray:
+    bands, height, width = data.shape
+    out_image = np.empty((bands, out_height, out_width), dtype=np.float64)
+
+    for row in prange(out_height):
+        src_row = min(int((row + 0.5) * scale_y), height - 1)
+        for col in range(out_width):
+            src_col = min(int((col + 0.5) * scale_x), width - 1)
+            for band in range(bands):
+                out_image[band, row, col] = data[band, src_row, src_col]
+
+    return out_image
+
+
+@njit(parallel=True, cache=True)
+def _bilinear_resample(
+    data: np.ndarray, out_height: int, out_width: int, scale_y: float, scale_x: float, nodata: float
+) -> np.ndarray:
+    bands, height, width = data.shape
+    out_image = np.empty((bands, out_height, out_width), dtype=np.float64)
+
+    for row in prange(out_height):
+        # Source coordinates of the output pixel center, clamped to the centers of the edge pixels
+        y = min(max((row + 0.5) * scale_y - 0.5, 0.0), height - 1.0)
+        row_0 = int(y)
+        row_1 = min(row_0 + 1, height - 1)
+        dy = y - row_0
+        for col in range(out_width):
+            x = min(max((col + 0.5) * scale_x - 0.5, 0.0), width - 1.0)
+            col_0 = int(x)
+            col_1 = min(col_0 + 1, width - 1)
+            dx = x - col_0
+
+            for band in range(bands):
+                values = (
+                    data[band, row_0, col_0],
+                    data[band, row_0, col_1],
+                    data[band, row_1, col_0],
+                    data[band, row_1, col_1],
+                )
+                weights = ((1 - dy) * (1 - dx), (1 - dy) * dx, dy * (1 - dx), dy * dx)
+
+                # Nodata and NaN values are left out and the weights of the remaining values renormalized
+                weighted_sum = 0.0
+                weight_sum = 0.0
+                for value, weight in zip(values, weights):
+                    if value != nodata and not np.isnan(value):
+                        weighted_sum += value * weight
+                        weight_sum += weight
+
+                out_image[band, row, col] = weighted_sum / weight_sum if weight_sum > 0 else nodata
+
+    return out_image
 
 
 def _resample(
-    raster: rasterio.io.DatasetReader, resolution: Number, resampling_method: Resampling
+    raster: rasterio.io.DatasetReader, resolution: Number, resampling_method: Resampling, in_memory: bool = False
 ) -> Tuple[np.ndarray, dict]:
 
     resolution = float(resolution)
@@ -32,31 +82,49 @@ def _resample(
     )
     out_transform = rasterio.Affine(resolution, 0, raster.transform[2], 0, -resolution, raster.transform[5])
 
-    dst = np.empty((raster.count, dst_height, dst_width))
-    dst.fill(raster.meta["nodata"])
-
-    out_image = warp.reproject(
-        source=raster.read(),
-        destination=dst,
-        src_transform=raster.transform,
-        src_crs=raster.crs,
-        dst_transform=out_transform,
-        dst_crs=raster.crs,
-        src_nodata=raster.meta["nodata"],
-        dst_nodata=raster.meta["nodata"],
-        resampling=resampling_method,
-    )
+    # The output size is truncated, so the pixel mapping uses the exact ratio of the resolutions to match
+    # the output transform
+    scale_x, scale_y = resolution / raster.res[0], resolution / raster.res[1]
+
+    # GDAL widens the bilinear kernel when downsampling, so only upsampling is computed in memory
+    if resampling_method == warp.Resampling.bilinear and max(scale_x, scale_y) > 1:
+        in_memory = False
+
+    if in_memory and resampling_method in IN_MEMORY_RESAMPLE_METHODS:
+        src_arr = raster.read().astype(np.float64)
+        if resampling_method == warp.Resampling.nearest:
+            out_image = _nearest_resample(src_arr, dst_height, dst_width, scale_y, scale_x)
+        else:
+            nodata = raster.meta["nodata"]
+            out_image = _bilinear_resample(
+                src_arr, dst_height, dst_width, scale_y, scale_x, np.nan if nodata is None else nodata
+            )
+    else:
+        dst = np.empty((raster.count, dst_height, dst_width))
+        dst.fill(raster.meta["nodata"])
+
+        out_image = warp.reproject(
+            source=raster.read(),
+            destination=dst,
+            src_transform=raster.transform,
+            src_crs=raster.crs,
+            dst_transform=out_transform,
+            dst_crs=raster.crs,
+            src_nodata=raster.meta["nodata"],
+            dst_nodata=raster.meta["nodata"],
+            resampling=resampling_method,
+        )[0]
 
     out_meta = raster.meta.copy()
     out_meta.update(
         {
             "transform": out_transform,
-            "width": out_image[0].shape[-1],
-            "height": out_image[0].shape[-2],
+            "width": out_image.shape[-1],
+            "height": out_image.shape[-2],
         }
     )
 
-    return out_image[0], out_meta
+    return out_image, out_meta
 
 
 @beartype
@@ -64,6 +132,7 @@ def resample(
     raster: rasterio.io.DatasetReader,
     resolution: Number,
     resampling_method: Literal["nearest", "bilinear", "cubic", "average", "gauss", "max", "min"] = "bilinear",
+    in_memory: bool = False,
 ) -> Tuple[np.ndarray, dict]:
     """Resamples raster according to given resolution.
 
@@ -73,6 +142,9 @@ def resample(
         resampling_method: Resampling method. Most suitable
             method depends on the dataset and context. Nearest, bilinear and cubic are some
             common choices. This parameter defaults to bilinear.
+        in_memory: If True, nearest resampling and bilinear upsampling are computed with a compiled
+            in-memory implementation instead of GDAL. Bilinear downsampling and other resampling
+            methods always use GDAL. Defaults to False.
 
     Returns:
         The resampled raster data.
@@ -84,6 +156,6 @@ def resample(
     if resolution <= 0:
         raise NumericValueSignException(f"Expected a positive value for resolution: {resolution})")
 
-    method = RESAMPLE_METHOD_MAP[resampling_method]
-    out_image, out_meta = _resample(raster, resolution, method)
+    method = warp.Resampling[resampling_method]
+    out_image, out_meta = _resample(raster, resolution, method, in_memory)
     return out_image, out_meta
@@ -6,7 +6,6 @@ from rasterio import warp
 from rasterio.enums import Resampling
 
 from eis_toolkit.exceptions import InvalidParameterValueException
-from eis_toolkit.raster_processing.resampling import RESAMPLE_METHOD_MAP
 
 
 def _unify_raster_grids(
@@ -112,6 +111,6 @@ def unify_raster_grids(
     if len(rasters_to_unify) == 0:
         raise InvalidParameterValueException("Rasters to unify is empty.")
 
-    method = RESAMPLE_METHOD_MAP[resampling_method]
+    method = warp.Resampling[resampling_method]
     out_rasters = _unify_raster_grids(base_raster, rasters_to_unify, method, same_extent)
     return out_rasters
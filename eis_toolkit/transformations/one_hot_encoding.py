@@ -3,7 +3,7 @@ from numbers import Number
 import numpy as np
 import pandas as pd
 from beartype import beartype
-from beartype.typing import Literal, Optional, Sequence, Union
+from beartype.typing import List, Literal, Optional, Sequence, Tuple, Union
 from scipy import sparse
 from sklearn.preprocessing import OneHotEncoder
 
@@ -11,6 +11,57 @@ from eis_toolkit.exceptions import EmptyDataFrameException, InvalidColumnExcepti
 from eis_toolkit.utilities.checks.dataframe import check_columns_valid
 
 
+def _can_factorize(column: pd.Series) -> bool:
+    # Categorical, extension dtype and mixed object columns are left to OneHotEncoder, which converts, orders
+    # and validates their categories differently
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biuf":
+        return True
+    return column.dtype == object and pd.api.types.infer_dtype(column, skipna=True) in ("string", "empty")
+
+
+def _factorize_columns(transform_df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    codes = np.empty(transform_df.shape, dtype=np.int64)
+    category_counts = np.empty(transform_df.shape[1], dtype=np.int64)
+    feature_names = []
+
+    for i, column in enumerate(transform_df.columns):
+        # Categories are sorted and missing values form the last category like in OneHotEncoder
+        column_data = transform_df[column]
+        codes[:, i], categories = pd.factorize(column_data, sort=True, use_na_sentinel=False)
+        category_names = [str(category) for category in categories]
+        if categories.hasnans:
+            # Factorize converts None to NaN, but the feature name should follow the original missing value
+            category_names[-1] = str(column_data[column_data.isna()].iloc[0])
+
+        category_counts[i] = len(categories)
+        feature_names.extend([str(column) + "_" + category_name for category_name in category_names])
+
+    return codes, category_counts, feature_names
+
+
+def _one_hot_encode_factorized(
+    codes: np.ndarray, category_counts: np.ndarray, sparse_output: bool, out_dtype: Union[type, np.dtype]
+) -> Union[np.ndarray, sparse.csr_matrix]:
+    n_rows, n_columns = codes.shape
+    column_offsets = np.concatenate(([0], np.cumsum(category_counts[:-1])))
+
+    # Every row has exactly one nonzero per encoded column, in increasing column order, so the CSR
+    # structure is known in advance and can be built without sorting any indices
+    encoded_data = sparse.csr_matrix(
+        (
+            np.ones(n_rows * n_columns, dtype=out_dtype),
+            (codes + column_offsets).ravel(),
+            np.arange(n_rows + 1, dtype=np.int64) * n_columns,
+        ),
+        shape=(n_rows, int(category_counts.sum())),
+    )
+
+    if not sparse_output:
+        encoded_data = encoded_data.toarray()
+
+    return encoded_data
+
+
 @beartype
 def one_hot_encode(
     data: Union[pd.DataFrame, np.ndarray],
@@ -18,7 +69,7 @@ def one_hot_encode(
     drop_original_columns: bool = True,
     drop_category: Optional[Literal["first", "if_binary"]] = None,
     sparse_output: bool = True,
-    out_dtype: Union[type, np.dtype] = int,
+    out_dtype: Union[type, np.dtype] = np.uint8,
     handle_unknown: Literal["error", "ignore", "infrequent_if_exist"] = "infrequent_if_exist",
     min_frequency: Optional[Number] = None,
     max_categories: Optional[int] = None,
@@ -46,7 +97,9 @@ def one_hot_encode(
             'first' drops the first category, 'if_binary' drops one category only if the feature is binary.
             If None, no category is dropped. Defaults to None.
         sparse_output: Determines whether the output matrix is sparse or dense. Defaults to True (sparse).
-        out_dtype: Numeric data type of the output. Defaults to int.
+        out_dtype: Numeric data type of the output. As encoded values are only 0 or 1, the default uint8
+            takes an eighth of the memory of 64-bit types. Give another type (e.g. int or float) if
+            required by later processing. Defaults to np.uint8.
         handle_unknown: Specifies how to handle unknown categories encountered during transform. 'error' raises
             an error, 'ignore' ignores unknown categories, and 'infrequent_if_exist' treats them as infrequent.
             Defaults to 'infrequent_if_exist'.
@@ -69,43 +122,56 @@ def one_hot_encode(
     if is_dataframe:
         if data.empty:
             raise EmptyDataFrameException("Input DataFrame is empty.")
-        df = data.copy()
 
         if columns is not None:
-            if not check_columns_valid(df, columns):
+            if not check_columns_valid(data, columns):
                 raise InvalidColumnException("All selected columns were not found in the input DataFrame.")
-            transform_df = df[columns]
+            transform_df = data[columns]
         else:
-            transform_df = df
+            transform_df = data
     else:
         if data.size == 0:
             raise InvalidDatasetException("Input array is empty.")
         transform_df = pd.DataFrame(data)
 
-    encoder = OneHotEncoder(
-        drop=drop_category,
-        sparse_output=sparse_output,
-        dtype=out_dtype,
-        handle_unknown=handle_unknown,
-        min_frequency=min_frequency,
-        max_categories=max_categories,
-        feature_name_combiner=lambda feature, category: str(feature) + "_" + str(category),
+    # Transform selected columns. Without dropped or infrequent categories, the encoding can be built directly
+    # from the factorized columns, which is much faster than fitting a OneHotEncoder. Max categories includes
+    # the infrequent category, so it has no effect when every column has fewer categories than that
+    use_encoder = (
+        drop_category is not None
+        or min_frequency is not None
+        or not all(_can_factorize(column_data) for _, column_data in transform_df.items())
     )
+    if not use_encoder:
+        codes, category_counts, encoded_cols = _factorize_columns(transform_df)
+        use_encoder = max_categories is not None and bool((category_counts >= max_categories).any())
 
-    # Transform selected columns
-    encoded_data = encoder.fit_transform(transform_df)
-    encoded_cols = encoder.get_feature_names_out(transform_df.columns)
+    if not use_encoder:
+        encoded_data = _one_hot_encode_factorized(codes, category_counts, sparse_output, out_dtype)
+    else:
+        encoder = OneHotEncoder(
+            drop=drop_category,
+            sparse_output=sparse_output,
+            dtype=out_dtype,
+            handle_unknown=handle_unknown,
+            min_frequency=min_frequency,
+            max_categories=max_categories,
+            feature_name_combiner=lambda feature, category: str(feature) + "_" + str(category),
+        )
+        encoded_data = encoder.fit_transform(transform_df)
+        encoded_cols = encoder.get_feature_names_out(transform_df.columns)
 
     # If input was a DataFrame, create output DataFrame
     if is_dataframe:
+        # Input data is not modified, so it's only copied once when dropping the original columns
+        df = data.drop(transform_df.columns, axis=1) if drop_original_columns else data
+
         if sparse_output:
             encoded_df = pd.DataFrame.sparse.from_spmatrix(encoded_data, columns=encoded_cols, index=df.index)
         else:
-            encoded_df = pd.DataFrame(encoded_data, columns=encoded_cols, index=df.index)
-
-        if drop_original_columns:
-            df = df.drop(transform_df.columns, axis=1)
+            encoded_df = pd.DataFrame(encoded_data, columns=encoded_cols, index=df.index, copy=False)
 
-        encoded_data = pd.concat([df, encoded_df], axis=1)
+        # Avoid copying the data of both frames again when combining them, unless the frame is the input itself
+        encoded_data = pd.concat([df, encoded_df], axis=1, copy=not drop_original_columns)
 
     return encoded_data
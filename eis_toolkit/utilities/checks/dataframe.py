@@ -31,8 +31,9 @@ def check_columns_numeric(df: pd.DataFrame, columns: Sequence[str]) -> bool:
     Returns:
         True if all columns are numeric, otherwise False.
     """
-    columns_numeric = df[columns].select_dtypes(include="number").columns.to_list()
-    return all(column in columns_numeric for column in columns)
+    # Only the dtypes are inspected, so the column data is not accessed
+    dtypes = df.dtypes[list(columns)]
+    return bool(dtypes.map(pd.api.types.is_numeric_dtype).all() and not dtypes.map(pd.api.types.is_bool_dtype).any())
 
 
 def check_empty_dataframe(df: pd.DataFrame) -> bool:
@@ -1,3 +1,4 @@
+from importlib.util import find_spec
 from pathlib import Path
 
 import geopandas as gpd
@@ -5,11 +6,34 @@ import numpy as np
 import pandas as pd
 import rasterio
 from beartype import beartype
-from beartype.typing import Literal, Sequence, Tuple, Union
+from beartype.typing import Iterator, Literal, Sequence, Tuple, Union
+from rasterio.windows import Window
 
 from eis_toolkit import exceptions
 from eis_toolkit.utilities.checks.raster import check_raster_grids
 
+# Vector files are read through pyogrio and Arrow when they are installed, as it is much faster than Fiona.
+# Note that pyogrio raises RuntimeErrors for unreadable files, whereas Fiona raises ValueErrors.
+PYOGRIO_AVAILABLE = find_spec("pyogrio") is not None
+PYARROW_AVAILABLE = find_spec("pyarrow") is not None
+
+
+def _read_vector_file(file_path: Union[str, Path]) -> gpd.GeoDataFrame:
+    if not PYOGRIO_AVAILABLE:
+        return gpd.read_file(file_path)
+
+    geodataframe = gpd.read_file(file_path, engine="pyogrio", use_arrow=PYARROW_AVAILABLE)
+
+    # pyogrio keeps the width of the fields (e.g. int32), whereas Fiona reads all integers and floats as 64-bit
+    narrow_dtypes = {
+        column: np.int64 if dtype.kind in "iu" else np.float64
+        for column, dtype in geodataframe.dtypes.items()
+        if isinstance(dtype, np.dtype) and dtype.kind in "iuf" and dtype.itemsize < 8
+    }
+    if narrow_dtypes:
+        geodataframe = geodataframe.astype(narrow_dtypes)
+    return geodataframe
+
 
 @beartype
 def read_file(file_path: Path) -> Union[rasterio.io.DatasetReader, gpd.GeoDataFrame, pd.DataFrame]:
@@ -35,8 +59,8 @@ def read_file(file_path: Path) -> Union[rasterio.io.DatasetReader, gpd.GeoDataFr
 
         # Try to read as a GeoDataFrame
         try:
-            data = gpd.read_file(file_path)
-        except (ValueError, OSError):
+            data = _read_vector_file(file_path)
+        except (ValueError, OSError, RuntimeError):
 
             # Try to read as a DataFrame
             try:
@@ -124,6 +148,61 @@ def read_and_stack_rasters(
     return stacked_arrays, profiles
 
 
+@beartype
+def aggregated_windows(
+    dataset: Union[rasterio.io.DatasetReader, rasterio.io.DatasetWriter], blocks_per_window: int = 16
+) -> Iterator[Window]:
+    """Get windows that cover the dataset, each consisting of multiple natural blocks of the dataset.
+
+    Consecutive blocks are combined along the rows for tiled rasters and across the rows for striped
+    rasters, so that each window can be read or written in one go without reading partial blocks.
+
+    Args:
+        dataset: Raster dataset (opened for reading or writing).
+        blocks_per_window: Number of natural blocks combined into one window. Defaults to 16.
+
+    Yields:
+        Windows covering the whole dataset in row-major order.
+    """
+    block_height, block_width = dataset.block_shapes[0]
+
+    if block_width < dataset.width:
+        window_height, window_width = block_height, block_width * blocks_per_window
+    else:
+        window_height, window_width = block_height * blocks_per_window, dataset.width
+
+    for row_off in range(0, dataset.height, window_height):
+        for col_off in range(0, dataset.width, window_width):
+            width = min(window_width, dataset.width - col_off)
+            height = min(window_height, dataset.height - row_off)
+            yield Window(col_off, row_off, width, height)
+
+
+@beartype
+def write_raster(output_raster: Union[str, Path], data: np.ndarray, meta: dict) -> None:
+    """Write raster data to a file.
+
+    GeoTIFF files are written as BigTIFF when needed. If the metadata sets a compression, GDAL compresses
+    the blocks using all CPUs. Uncompressed files are written in a single thread.
+
+    Args:
+        output_raster: Output file path.
+        data: Raster data. 2D array is written as a single band, 3D array should have shape (bands, height, width).
+        meta: Raster metadata.
+    """
+    profile = meta.copy()
+    driver = profile.get("driver") or rasterio.drivers.driver_from_extension(output_raster)
+    if driver == "GTiff":
+        profile.setdefault("NUM_THREADS", "ALL_CPUS")
+        profile.setdefault("BIGTIFF", "IF_SAFER")
+
+    with rasterio.open(output_raster, "w", **profile) as dst:
+        if data.ndim == 2:
+            dst.write(data, 1)
+        else:
+            dst.write(data)
+
+
 @beartype
 def read_vector(file_path: Path) -> gpd.GeoDataFrame:
     """Read a vector file to a GeoDataFrame.
@@ -138,8 +217,8 @@ def read_vector(file_path: Path) -> gpd.GeoDataFrame:
         FileReadError: Geopandas failed to read the input file.
     """
     try:
-        data = gpd.read_file(file_path)
-    except (ValueError, OSError):
+        data = _read_vector_file(file_path)
+    except (ValueError, OSError, RuntimeError):
         raise exceptions.FileReadError(f"Failed to read vector data from {file_path}.")
     return data
 
@@ -1,4 +1,6 @@
+import warnings
 from numbers import Number
+from types import ModuleType
 
 import geopandas as gpd
 import numpy as np
@@ -7,10 +9,54 @@ from beartype.typing import Literal, Optional, Tuple
 from pykrige.ok import OrdinaryKriging
 from pykrige.uk import UniversalKriging
 from rasterio import transform
+from scipy import linalg
 
 from eis_toolkit.exceptions import EmptyDataFrameException, InvalidParameterValueException
 
 
+class _ArrayModuleOrdinaryKriging(OrdinaryKriging):
+    """Ordinary kriging that solves the kriging system for all grid points with the given array module."""
+
+    def __init__(self, *args, array_module: ModuleType, **kwargs):
+        self.array_module = array_module
+        super().__init__(*args, **kwargs)
+
+    def _exec_vector(self, a, bd, mask):
+        if self.pseudo_inv or mask.any():
+            return super()._exec_vector(a, bd, mask)
+
+        xp = self.array_module
+        n = self.X_ADJUSTED.shape[0]
+
+        b = np.zeros((bd.shape[0], n + 1))
+        b[:, :n] = -self.variogram_function(self.variogram_model_parameters, bd)
+        if self.exact_values:
+            b[:, :n][np.absolute(bd) <= self.eps] = 0.0
+        b[:, n] = 1.0
+
+        # Multiplying the vectors of every grid point with the inverted kriging matrix dominates the runtime
+        # for large grids, so only this step is done with the array module
+        x = xp.matmul(xp.asarray(b), xp.asarray(linalg.inv(a)).T)
+        x = getattr(xp, "asnumpy", np.asarray)(x)
+
+        zvalues = x[:, :n] @ self.Z
+        sigmasq = np.sum(x * -b, axis=1)
+        return zvalues, sigmasq
+
+
+def _import_cupy() -> Optional[ModuleType]:
+    try:
+        import cupy
+
+        # CuPy can be imported without usable CUDA libraries or a device, so check that it can multiply matrices
+        cupy.matmul(cupy.ones((1, 1)), cupy.ones((1, 1)))
+    except (ImportError, OSError, RuntimeError) as e:
+        warnings.warn(f"CuPy cannot be used, computing kriging on the CPU instead: {e}")
+        return None
+
+    return cupy
+
+
 def _kriging(
     data: gpd.GeoDataFrame,
     target_column: str,
@@ -19,6 +65,7 @@ def _kriging(
     variogram_model: Literal,
     coordinates_type: Literal,
     method: Literal,
+    device: Literal,
 ) -> Tuple[np.ndarray, dict]:
 
     x = data.geometry.x
@@ -42,7 +89,15 @@ def _kriging(
         z_interpolated, _ = universal_kriging.execute("grid", grid_x, grid_y)
 
     if method == "ordinary":
-        ordinary_kriging = OrdinaryKriging(x, y, z, variogram_model=variogram_model, coordinates_type=coordinates_type)
+        cupy = _import_cupy() if device == "cuda" else None
+        if cupy is not None:
+            ordinary_kriging = _ArrayModuleOrdinaryKriging(
+                x, y, z, variogram_model=variogram_model, coordinates_type=coordinates_type, array_module=cupy
+            )
+        else:
+            ordinary_kriging = OrdinaryKriging(
+                x, y, z, variogram_model=variogram_model, coordinates_type=coordinates_type
+            )
         z_interpolated, _ = ordinary_kriging.execute("grid", grid_x, grid_y)
 
     out_meta = {
@@ -64,6 +119,7 @@ def kriging(
     variogram_model: Literal["linear", "power", "gaussian", "spherical", "exponential"] = "linear",
     coordinates_type: Literal["euclidean", "geographic"] = "geographic",
     method: Literal["ordinary", "universal"] = "ordinary",
+    device: Literal["cpu", "cuda"] = "cpu",
 ) -> Tuple[np.ndarray, dict]:
     """
     Perform Kriging interpolation on the input data.
@@ -79,6 +135,8 @@ def kriging(
         coordinates_type: Determines are coordinates on a plane ('euclidean') or a sphere ('geographic').
             Used only in ordinary kriging. Defaults to 'geographic'.
         method: Ordinary or universal kriging. Defaults to 'ordinary'.
+        device: Compute the predictions on the 'cpu' or on a 'cuda' GPU. Using a GPU requires CuPy and is
+            used only in ordinary kriging. Falls back to the CPU if CuPy cannot be used. Defaults to 'cpu'.
 
     Returns:
         Grid containing the interpolated values and metadata.
@@ -100,7 +158,7 @@ def kriging(
         raise InvalidParameterValueException("The resolution must be greater than zero.")
 
     data_interpolated, out_meta = _kriging(
-        data, target_column, resolution, extent, variogram_model, coordinates_type, method
+        data, target_column, resolution, extent, variogram_model, coordinates_type, method, device
     )
 
     return data_interpolated, out_meta
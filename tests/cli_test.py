@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import geopandas as gpd
+import numpy as np
+import rasterio
+from typer.testing import CliRunner
+
+from eis_toolkit.cli import app
+from eis_toolkit.vector_processing.rasterize_vector import rasterize_vector
+
+test_dir = Path(__file__).parent
+vector_path = test_dir.joinpath("data/remote/small_area.shp")
+raster_path = test_dir.joinpath("data/remote/small_raster.tif")
+rasterize_output_path = test_dir.joinpath("data/local/results/rasterize_cli_test_result.tif")
+
+runner = CliRunner()
+
+
+def test_rasterize_cli():
+    """Test that rasterize CLI writes the rasterized band to the output file."""
+    result = runner.invoke(
+        app,
+        [
+            "rasterize-cli",
+            "--input-vector",
+            str(vector_path),
+            "--output-raster",
+            str(rasterize_output_path),
+            "--base-raster-profile-raster",
+            str(raster_path),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+
+    with rasterio.open(raster_path) as raster:
+        base_raster_profile = raster.profile
+    expected_image, _ = rasterize_vector(gpd.read_file(vector_path), base_raster_profile=base_raster_profile)
+    with rasterio.open(rasterize_output_path) as raster:
+        assert raster.count == 1
+        np.testing.assert_array_equal(raster.read(1), expected_image)
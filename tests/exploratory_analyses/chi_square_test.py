@@ -18,3 +18,10 @@ def test_invalid_target_column():
     """Test that invalid target column raises the correct exception."""
     with pytest.raises(InvalidParameterValueException):
         chi_square_test(data=DATA, target_column="invalid_column")
+
+
+def test_chi_square_test_with_missing_values():
+    """Test that rows with missing values are left out of the contingency table."""
+    data = pd.DataFrame({"e": [0, 0, 1, 1, 2, np.nan], "f": ["a", "b", "a", "a", np.nan, "b"]})
+    output_statistics = chi_square_test(data=data, target_column="e", columns=["f"])
+    np.testing.assert_array_equal(list(output_statistics["f"].values()), [0.0, 1.0, 1])
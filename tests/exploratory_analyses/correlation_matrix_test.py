@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 import pytest
 from beartype.roar import BeartypeCallHintParamViolation
 
@@ -35,6 +36,13 @@ def test_correlation_matrix():
     np.testing.assert_array_almost_equal(output_matrix, expected_correlation_matrix)
 
 
+def test_correlation_matrix_excludes_timedelta():
+    """Test that timedelta columns are excluded from the correlation matrix like pandas does."""
+    data = pd.DataFrame({"a": [1.0, 2.0, 4.0], "td": pd.to_timedelta([1, 3, 2], unit="s")})
+    output_matrix = correlation_matrix(data=data)
+    pd.testing.assert_frame_equal(output_matrix, pd.DataFrame({"a": {"a": 1.0}}))
+
+
 def test_correlation_matrix_non_numeric():
     """Test that returned correlation matrix is correct."""
     with pytest.raises(NonNumericDataException):
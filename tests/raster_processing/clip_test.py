@@ -4,9 +4,12 @@ import geopandas
 import numpy as np
 import pytest
 import rasterio
+from rasterio.transform import from_origin
+from shapely.geometry import Point
 
 from eis_toolkit.exceptions import GeometryTypeException, NonMatchingCrsException
-from eis_toolkit.raster_processing.clipping import clip_raster
+from eis_toolkit.raster_processing import clipping
+from eis_toolkit.raster_processing.clipping import clip_and_write_raster, clip_raster
 
 test_dir = Path(__file__).parent.parent
 raster_path = test_dir.joinpath("data/remote/small_raster.tif")
@@ -16,6 +19,8 @@ wrong_crs_polygon_path = test_dir.joinpath("data/remote/small_area.geojson")
 
 # Save output to local to not push it
 output_raster_path = test_dir.joinpath("data/local/results/clip_test_result.tif")
+windowed_output_raster_path = test_dir.joinpath("data/local/results/clip_test_windowed_result.tif")
+large_raster_path = test_dir.joinpath("data/local/results/clip_test_large_raster.tif")
 
 
 def test_clip_raster():
@@ -40,6 +45,55 @@ def test_clip_raster():
         assert result.bounds[3] == 6671364.0
 
 
+def test_clip_and_write_raster():
+    """Test that windowed clipping writes the same raster as clip_raster."""
+    geodataframe = geopandas.read_file(polygon_path)
+
+    with rasterio.open(raster_path) as raster:
+        out_image, out_meta = clip_raster(raster=raster, geodataframe=geodataframe)
+        windowed_out_meta = clip_and_write_raster(
+            raster=raster, geodataframe=geodataframe, output_raster=windowed_output_raster_path
+        )
+
+    assert windowed_out_meta == out_meta
+    with rasterio.open(windowed_output_raster_path) as result:
+        np.testing.assert_array_equal(result.read(), out_image)
+
+
+def test_clip_and_write_raster_multiple_windows(monkeypatch):
+    """Test that windowed clipping matches clip_raster when windows do not intersect all or any geometries."""
+    meta = {
+        "driver": "GTiff",
+        "dtype": "float32",
+        "nodata": -9999.0,
+        "width": 300,
+        "height": 200,
+        "count": 1,
+        "crs": rasterio.crs.CRS.from_epsg(3067),
+        "transform": from_origin(300000, 7000000, 10, 10),
+    }
+    with rasterio.open(large_raster_path, "w", **meta) as dst:
+        dst.write(np.arange(200 * 300, dtype="float32").reshape(1, 200, 300))
+
+    # The circles are far apart, so some windows intersect one of them and some neither
+    geodataframe = geopandas.GeoDataFrame(
+        geometry=[Point(300505, 6999505).buffer(400), Point(302505, 6998505).buffer(400)], crs="EPSG:3067"
+    )
+    # Process the raster one block at a time
+    monkeypatch.setattr(clipping, "WINDOW_MEMORY_BUDGET", 1)
+
+    with rasterio.open(large_raster_path) as raster:
+        out_image, out_meta = clip_raster(raster=raster, geodataframe=geodataframe)
+        windowed_out_meta = clip_and_write_raster(
+            raster=raster, geodataframe=geodataframe, output_raster=windowed_output_raster_path
+        )
+
+    assert windowed_out_meta == out_meta
+    with rasterio.open(windowed_output_raster_path) as result:
+        assert result.height > result.block_shapes[0][0]
+        np.testing.assert_array_equal(result.read(), out_image)
+
+
 def test_clip_raster_wrong_geometry_type():
     """Tests that non-polygon geometry raises the correct exception."""
     with pytest.raises(GeometryTypeException):
@@ -3,13 +3,16 @@ from pathlib import Path
 import numpy as np
 import pytest
 import rasterio
+from rasterio.transform import from_origin
 
 from eis_toolkit.exceptions import MatchingCrsException
-from eis_toolkit.raster_processing.reprojecting import reproject_raster
+from eis_toolkit.raster_processing.reprojecting import reproject_and_write_raster, reproject_raster
 from tests.raster_processing.clip_test import raster_path as SMALL_RASTER_PATH
 
 test_dir = Path(__file__).parent.parent
 reference_solution_path = test_dir.joinpath("data/remote/small_raster_EPSG4326.tif")
+output_raster_path = test_dir.joinpath("data/local/results/reproject_test_windowed_result.tif")
+large_raster_path = test_dir.joinpath("data/local/results/reproject_test_large_raster.tif")
 
 src_raster = rasterio.open(SMALL_RASTER_PATH)
 reprojected_data, reprojected_meta = reproject_raster(src_raster, 4326)
@@ -40,6 +43,68 @@ def test_reproject_meta():
     assert abs(reprojected_meta["transform"][5] - reference_meta["transform"][5]) < 0.00000001
 
 
+def test_reproject_and_write_raster():
+    """Test that windowed reprojection writes the same raster as reproject_raster."""
+    out_meta = reproject_and_write_raster(src_raster, 4326, output_raster_path, max_workers=2)
+
+    assert out_meta == reprojected_meta
+    with rasterio.open(output_raster_path) as result:
+        np.testing.assert_array_equal(result.read(), reference_data)
+
+
+@pytest.fixture(scope="module")
+def large_raster():
+    """Return a gradient raster that is reprojected in several windows."""
+    height, width = 700, 900
+    rows, cols = np.mgrid[0:height, 0:width]
+    data = cols + 2.0 * rows
+    meta = {
+        "driver": "GTiff",
+        "dtype": "float64",
+        "nodata": -9999.0,
+        "width": width,
+        "height": height,
+        "count": 1,
+        "crs": rasterio.crs.CRS.from_epsg(3067),
+        "transform": from_origin(300000, 7000000, 250, 250),
+    }
+    with rasterio.open(large_raster_path, "w", **meta) as dst:
+        dst.write(data, 1)
+
+    with rasterio.open(large_raster_path) as raster:
+        yield raster
+
+
+@pytest.mark.parametrize("resampling_method", ["nearest", "bilinear", "cubic", "max"])
+def test_reproject_and_write_raster_multiple_windows(large_raster, resampling_method):
+    """Test that windowed reprojection matches reproject_raster when using several windows.
+
+    Both use GDAL's approximate transformer (error at most 1/8 pixel), so values may differ slightly.
+    """
+    expected_data, expected_meta = reproject_raster(large_raster, 4326, resampling_method)
+    out_meta = reproject_and_write_raster(
+        large_raster, 4326, output_raster_path, resampling_method, max_workers=2, gdal_cache_max=64
+    )
+
+    assert out_meta == expected_meta
+    with rasterio.open(output_raster_path) as result:
+        assert result.height > 128
+        out_data = result.read()
+
+    nodata = expected_meta["nodata"]
+    assert np.mean((out_data == nodata) != (expected_data == nodata)) < 0.001
+
+    valid = (out_data != nodata) & (expected_data != nodata)
+    difference = np.abs(out_data - expected_data)[valid]
+    if resampling_method in ("nearest", "max"):
+        # A pixel may come from a neighbouring source pixel, which differs by at most 2 in the gradient
+        assert difference.max() <= 2
+        assert np.mean(difference == 0) > 0.9
+    else:
+        # Two positions 1/4 pixel apart differ by at most sqrt(1 + 2 ** 2) / 4 in the gradient
+        assert difference.max() <= np.sqrt(5) / 4
+
+
 def test_same_crs():
     """Test that a crs match raises the correct exception."""
     with pytest.raises(MatchingCrsException):
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 import rasterio
 from rasterio import Affine
@@ -24,6 +25,23 @@ def test_resample():
         )
 
 
+@pytest.mark.parametrize(
+    "resampling_method,upscale_factor",
+    [("nearest", 0.25), ("bilinear", 0.25), ("nearest", 0.3), ("bilinear", 0.3), ("nearest", 1.7), ("nearest", 3)],
+)
+def test_resample_in_memory(resampling_method, upscale_factor):
+    """Test that in-memory resampling gives the same result as resampling with GDAL."""
+    with rasterio.open(SMALL_RASTER_PATH) as raster:
+        target_resolution = raster.res[0] * upscale_factor
+        gdal_image, gdal_meta = resample(raster, target_resolution, resampling_method=resampling_method)
+        in_memory_image, in_memory_meta = resample(
+            raster, target_resolution, resampling_method=resampling_method, in_memory=True
+        )
+
+    assert in_memory_meta == gdal_meta
+    np.testing.assert_allclose(in_memory_image, gdal_image)
+
+
 def test_resample_negative_upscale_factor():
     """Tests that invalid parameter value for resampling method raises the correct exception."""
     with pytest.raises(NumericValueSignException):
@@ -47,8 +47,54 @@ def test_encode_numpy_array_sparse(sample_numpy_array):
     assert isinstance(encoded_data, scipy.sparse._csr.csr_matrix)
 
 
+def test_encode_out_dtype(sample_dataframe, sample_numpy_array):
+    """Test that encoded data is uint8 by default and that the output data type can be changed."""
+    assert one_hot_encode(sample_numpy_array).dtype == np.uint8
+    assert one_hot_encode(sample_numpy_array, sparse_output=False, out_dtype=float).dtype == np.float64
+
+    encoded_df = one_hot_encode(sample_dataframe, columns=["A"], sparse_output=False)
+    assert (encoded_df[["A_cat", "A_dog", "A_fish"]].dtypes == np.uint8).all()
+
+
 def test_encode_numpy_array_dense(sample_numpy_array):
     """Test that encoding Numpy array with dense output works as expected."""
     encoded_data = one_hot_encode(sample_numpy_array, sparse_output=False)
     assert isinstance(encoded_data, np.ndarray)
     assert len(encoded_data[0]) > len(sample_numpy_array[0])
+
+
+def test_encode_dataframe_matches_one_hot_encoder(sample_dataframe):
+    """Test that the direct encoding gives the same result as encoding with a fitted OneHotEncoder."""
+    sample_dataframe.loc[1, "A"] = None
+    encoded_df = one_hot_encode(sample_dataframe, sparse_output=False)
+    # Setting min_frequency makes the function fit a OneHotEncoder
+    encoder_encoded_df = one_hot_encode(sample_dataframe, sparse_output=False, min_frequency=1)
+    pd.testing.assert_frame_equal(encoded_df, encoder_encoded_df)
+
+
+@pytest.mark.parametrize(
+    "column",
+    [pd.array([1, None, 2], dtype="Int64"), pd.Categorical(["b", "c", "a"], categories=["c", "b", "a"])],
+    ids=["nullable_integer", "categorical"],
+)
+def test_encode_extension_dtypes_match_one_hot_encoder(column):
+    """Test that columns with extension dtypes get the same categories and names as with a OneHotEncoder."""
+    df = pd.DataFrame({"A": column})
+    encoded_df = one_hot_encode(df, sparse_output=False)
+    encoder_encoded_df = one_hot_encode(df, sparse_output=False, min_frequency=1)
+    pd.testing.assert_frame_equal(encoded_df, encoder_encoded_df)
+
+
+def test_encode_mixed_type_column():
+    """Test that a column mixing strings and numbers raises an error instead of giving duplicate columns."""
+    df = pd.DataFrame({"A": pd.Series(["x", 1, "1"], dtype=object)})
+    with pytest.raises(TypeError):
+        one_hot_encode(df)
+
+
+def test_encode_max_categories_not_reached(sample_dataframe):
+    """Test that max categories does not change the encoding when all columns have fewer categories."""
+    encoded_df = one_hot_encode(sample_dataframe, sparse_output=False)
+    pd.testing.assert_frame_equal(one_hot_encode(sample_dataframe, sparse_output=False, max_categories=4), encoded_df)
+    encoder_encoded_df = one_hot_encode(sample_dataframe, sparse_output=False, min_frequency=1, max_categories=4)
+    pd.testing.assert_frame_equal(encoder_encoded_df, encoded_df)
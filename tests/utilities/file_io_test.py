@@ -0,0 +1,38 @@
+from pathlib import Path
+
+import geopandas as gpd
+import numpy as np
+import pytest
+import rasterio
+
+from eis_toolkit.utilities.file_io import read_vector, write_raster
+
+test_dir = Path(__file__).parent.parent
+raster_path = test_dir.joinpath("data/remote/small_raster.tif")
+output_raster_path = test_dir.joinpath("data/local/results/write_raster_test_result.tif")
+
+
+def test_write_raster():
+    """Test that 2D and 3D raster data are written correctly."""
+    with rasterio.open(raster_path) as raster:
+        data = raster.read()
+        meta = raster.meta.copy()
+
+    for out_image in [data, data[0]]:
+        write_raster(output_raster_path, out_image, meta)
+        with rasterio.open(output_raster_path) as result:
+            assert result.meta == meta
+            np.testing.assert_array_equal(result.read(), data)
+
+
+@pytest.mark.parametrize(
+    "vector_file",
+    ["data/remote/test.gpkg", "data/remote/Test_CBA_matrix.geojson", "data/remote/wofe/wofe_deposits.shp"],
+)
+def test_read_vector_dtypes(vector_file):
+    """Test that read_vector gives the same column dtypes as reading with Fiona."""
+    vector_path = test_dir.joinpath(vector_file)
+    result = read_vector(vector_path)
+    expected = gpd.read_file(vector_path, engine="fiona")
+
+    assert result.dtypes.to_dict() == expected.dtypes.to_dict()
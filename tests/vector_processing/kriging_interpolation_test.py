@@ -1,11 +1,15 @@
+import sys
+import types
+
 import geopandas as gpd
 import numpy as np
 import pandas as pd
 import pytest
 from beartype.roar import BeartypeCallHintParamViolation
+from pykrige.ok import OrdinaryKriging
 
 from eis_toolkit.exceptions import EmptyDataFrameException, InvalidParameterValueException
-from eis_toolkit.vector_processing.kriging_interpolation import kriging
+from eis_toolkit.vector_processing.kriging_interpolation import _ArrayModuleOrdinaryKriging, kriging
 
 np.random.seed(0)
 x = np.random.uniform(0, 5, size=(10, 1))
@@ -52,6 +56,37 @@ def test_output_without_extent():
     assert round(z_interpolated[-1][-1], 8) == expected_value_last_pixel
 
 
+def test_ordinary_kriging_array_module():
+    """Test that solving the kriging system with an array module gives the same result as PyKrige."""
+    grid_x = grid_y = np.arange(0, 5, 0.5)
+    expected_z, expected_sigmasq = OrdinaryKriging(x, y, z).execute("grid", grid_x, grid_y)
+    z_interpolated, sigmasq = _ArrayModuleOrdinaryKriging(x, y, z, array_module=np).execute("grid", grid_x, grid_y)
+    np.testing.assert_allclose(z_interpolated, expected_z)
+    np.testing.assert_allclose(sigmasq, expected_sigmasq)
+
+
+class _UnusableCupy(types.ModuleType):
+    """CuPy module that can be imported but has no usable CUDA device."""
+
+    def __init__(self):
+        super().__init__("cupy")
+
+    def __getattr__(self, name):
+        raise RuntimeError("cudaErrorNoDevice: no CUDA-capable device is detected")
+
+
+@pytest.mark.parametrize("cupy_module", [None, _UnusableCupy()], ids=["not_installed", "no_device"])
+def test_cuda_device_fallback(monkeypatch, cupy_module):
+    """Test that kriging falls back to the CPU when CuPy cannot be used."""
+    monkeypatch.setitem(sys.modules, "cupy", cupy_module)
+    expected_z, _ = kriging(data=gdf, target_column=target_column, resolution=resolution, extent=extent)
+    with pytest.warns(UserWarning):
+        z_interpolated, _ = kriging(
+            data=gdf, target_column=target_column, resolution=resolution, extent=extent, device="cuda"
+        )
+    np.testing.assert_array_equal(z_interpolated, expected_z)
+
+
 def test_empty_geodataframe():
     """Test that empty geodataframe raises the correct exception."""
     empty_gdf = gpd.GeoDataFrame()